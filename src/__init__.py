@@ -1,2 +1,2 @@
-# EDCopilot Chit Chat Updater
-# Main package initialization
+# EDCopilot Chit Chat Updater
+# Main package initialization
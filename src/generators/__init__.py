@@ -1 +1 @@
-# Content generators package for EDCopilot Chit Chat Updater
+# Content generators package for EDCopilot Chit Chat Updater
@@ -1 +1 @@
-# Utils package for EDCopilot Chit Chat Updater
+# Utils package for EDCopilot Chit Chat Updater
@@ -1,178 +1,434 @@
-"""
-API Client module for EDCopilot Chit Chat Updater
-Handles OpenAI and Anthropic API interactions with failover capabilities
-"""
-
-import time
-import logging
-from typing import Optional, List, Dict, Any
-from openai import OpenAI
-from anthropic import Anthropic
-from src.config import Config
-from src.utils.personalization import PersonalizationManager
-
-logger = logging.getLogger(__name__)
-
-class APIClient:
-    """API Client for handling OpenAI and Anthropic interactions"""
-    
-    def __init__(self):
-        self.openai_client = None
-        self.anthropic_client = None
-        self.personalization_manager = PersonalizationManager()
-        self._initialize_clients()
-    
-    def _initialize_clients(self):
-        """Initialize API clients if keys are available"""
-        if Config.OPENAI_API_KEY:
-            self.openai_client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        
-        if Config.ANTHROPIC_API_KEY:
-            self.anthropic_client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
-    
-    def generate_content(self, prompt: str, chatter_type: str, max_retries: int = None, 
-                        include_personalization: bool = True, include_rss: bool = True, include_web: bool = True) -> Optional[str]:
-        """
-        Generate content using the preferred provider with automatic failover
-        
-        Args:
-            prompt: The prompt to send to the AI model
-            chatter_type: Type of chatter (for logging purposes)
-            max_retries: Maximum number of retries per provider
-            include_personalization: Whether to include personalization context
-            include_rss: Whether to include RSS feed content
-            include_web: Whether to include web content
-            
-        Returns:
-            Generated content string or None if all providers fail
-        """
-        if max_retries is None:
-            max_retries = Config.MAX_RETRIES
-        
-        # If personalization is already included in the prompt, use it as-is
-        if not include_personalization:
-            enhanced_prompt = prompt
-        else:
-            # Legacy method - add personalization context to the top
-            personalization_context = self.personalization_manager.get_personalization_context(
-                include_rss=include_rss, include_web=include_web)
-            if personalization_context:
-                enhanced_prompt = f"{personalization_context}\n\n{prompt}"
-                logger.info(f"🎯 Enhanced prompt with personalization context for {chatter_type}")
-            else:
-                enhanced_prompt = prompt
-        
-        provider_order = Config.get_provider_order()
-        
-        for provider in provider_order:
-            logger.info(f"🔄 Trying {provider} for {chatter_type}")
-            
-            try:
-                if provider == 'OPENAI' and self.openai_client:
-                    content = self._generate_openai(enhanced_prompt, max_retries)
-                    if content:
-                        logger.info(f"✅ Successfully generated {chatter_type} content using OpenAI")
-                        return content
-                
-                elif provider == 'ANTHROPIC' and self.anthropic_client:
-                    content = self._generate_anthropic(enhanced_prompt, max_retries)
-                    if content:
-                        logger.info(f"✅ Successfully generated {chatter_type} content using Anthropic")
-                        return content
-                
-            except Exception as e:
-                logger.error(f"❌ {provider} failed for {chatter_type}: {str(e)}")
-                continue
-        
-        logger.error(f"❌ All providers failed for {chatter_type}")
-        return None
-    
-    def _generate_openai(self, prompt: str, max_retries: int) -> Optional[str]:
-        """Generate content using OpenAI API with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = self.openai_client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that generates engaging conversation content for a space-themed game."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=1000,
-                    temperature=0.8
-                )
-                
-                content = response.choices[0].message.content.strip()
-                if content:
-                    return content
-                    
-            except Exception as e:
-                logger.warning(f"OpenAI attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-        
-        return None
-    
-    def _generate_anthropic(self, prompt: str, max_retries: int) -> Optional[str]:
-        """Generate content using Anthropic API with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = self.anthropic_client.messages.create(
-                    model=Config.ANTHROPIC_MODEL,
-                    max_tokens=1000,
-                    temperature=0.8,
-                    system="You are a helpful assistant that generates engaging conversation content for a space-themed game.",
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                
-                content = response.content[0].text.strip()
-                if content:
-                    return content
-                    
-            except Exception as e:
-                logger.warning(f"Anthropic attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-        
-        return None
-    
-    def test_connectivity(self) -> Dict[str, bool]:
-        """Test connectivity to both API providers"""
-        results = {}
-        
-        # Test OpenAI
-        if self.openai_client:
-            try:
-                response = self.openai_client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
-                    messages=[{"role": "user", "content": "Hello"}],
-                    max_tokens=10
-                )
-                results['OPENAI'] = True
-                logger.info("✅ OpenAI connectivity test passed")
-            except Exception as e:
-                results['OPENAI'] = False
-                logger.error(f"❌ OpenAI connectivity test failed: {str(e)}")
-        else:
-            results['OPENAI'] = False
-            logger.warning("⚠️ OpenAI client not initialized (missing API key)")
-        
-        # Test Anthropic
-        if self.anthropic_client:
-            try:
-                response = self.anthropic_client.messages.create(
-                    model=Config.ANTHROPIC_MODEL,
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "Hello"}]
-                )
-                results['ANTHROPIC'] = True
-                logger.info("✅ Anthropic connectivity test passed")
-            except Exception as e:
-                results['ANTHROPIC'] = False
-                logger.error(f"❌ Anthropic connectivity test failed: {str(e)}")
-        else:
-            results['ANTHROPIC'] = False
-            logger.warning("⚠️ Anthropic client not initialized (missing API key)")
-        
-        return results
+"""
+API Client module for EDCopilot Chit Chat Updater
+Handles OpenAI and Anthropic API interactions with failover capabilities
+"""
+
+import re
+import time
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are a helpful assistant that generates engaging conversation content for a space-themed game."
+
+# Batched requests ask the model to wrap each answer in <<<TAG>>> ... <<<END_TAG>>> markers
+MULTI_SYSTEM_PROMPT = (
+    f"{SYSTEM_PROMPT} You will receive several independent requests, each wrapped in "
+    "<<<TAG>>> and <<<END_TAG>>> markers. Answer every request separately and wrap each "
+    "answer in the same markers as its request, emitting nothing outside the markers."
+)
+
+# Matches rate limit reset durations such as "1s", "6m0s" or "250ms"
+_DURATION_PART_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+class RateLimiter:
+    """Caps concurrent API requests and paces them below per-minute request/token limits"""
+    
+    def __init__(self, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int):
+        self._sem = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        self._rpm_limit = float(max(1, requests_per_minute))
+        self._tpm_limit = float(max(1, tokens_per_minute))
+        self._rpm_bucket = self._rpm_limit
+        self._tpm_bucket = self._tpm_limit
+        self._last_refill = time.monotonic()
+    
+    def _refill(self, now: float):
+        """Top up both buckets in proportion to the time elapsed since the last refill"""
+        elapsed = now - self._last_refill
+        self._rpm_bucket = min(self._rpm_limit, self._rpm_bucket + elapsed * self._rpm_limit / 60)
+        self._tpm_bucket = min(self._tpm_limit, self._tpm_bucket + elapsed * self._tpm_limit / 60)
+        self._last_refill = now
+    
+    def _await_capacity(self, estimated_tokens: int):
+        """Block until one request and the estimated tokens fit within the buckets"""
+        # A single request larger than the whole budget would otherwise wait forever
+        estimated_tokens = min(float(estimated_tokens), self._tpm_limit)
+        
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._rpm_bucket >= 1 and self._tpm_bucket >= estimated_tokens:
+                    self._rpm_bucket -= 1
+                    self._tpm_bucket -= estimated_tokens
+                    return
+                
+                wait = max((1 - self._rpm_bucket) * 60 / self._rpm_limit,
+                           (estimated_tokens - self._tpm_bucket) * 60 / self._tpm_limit)
+            
+            logger.info(f"⏳ Rate limit budget exhausted, waiting {wait:.1f}s")
+            time.sleep(wait)
+    
+    @contextmanager
+    def slot(self, estimated_tokens: int):
+        """Hold a concurrency slot with request/token capacity reserved for one API call"""
+        with self._sem:
+            self._await_capacity(estimated_tokens)
+            yield
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a rate limit header value ("20", "1.5", "6m0s", "250ms") into seconds"""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Get the number of seconds to wait before retrying a failed request
+    
+    Rate limit errors (HTTP 429 from either SDK) honour the server supplied
+    reset headers; anything else falls back to exponential backoff.
+    """
+    if getattr(error, 'status_code', None) == 429:
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        for header in ('retry-after-ms', 'retry-after', 'x-ratelimit-reset-requests'):
+            value = headers.get(header)
+            if not value:
+                continue
+            if header == 'retry-after-ms':
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    continue
+            delay = _parse_duration(value)
+            if delay is not None:
+                return delay
+    
+    return 2 ** attempt
+
+
+class APIClient:
+    """API Client for handling OpenAI and Anthropic interactions"""
+    
+    # Shared by every client in the process so all generators draw from one budget
+    _rate_limiter: Optional[RateLimiter] = None
+    _rate_limiter_lock = threading.Lock()
+    
+    # One pooled HTTP/2 connection shared by both SDK clients for the process lifetime
+    _http_client = None
+    _http_client_lock = threading.Lock()
+    
+    # One personalization manager per process, so its memoized context and RSS data are shared by all generators
+    _personalization_manager = None
+    _personalization_manager_lock = threading.Lock()
+    
+    def __init__(self):
+        self.openai_client = None
+        self.anthropic_client = None
+        self.rate_limiter = self._get_rate_limiter()
+        self._initialize_clients()
+    
+    @property
+    def personalization_manager(self):
+        """Personalization manager, created on first use to keep startup light"""
+        return self._get_personalization_manager()
+    
+    @classmethod
+    def _get_personalization_manager(cls):
+        """Get the process-wide personalization manager, creating it on first use"""
+        with cls._personalization_manager_lock:
+            if cls._personalization_manager is None:
+                from src.utils.personalization import PersonalizationManager
+                cls._personalization_manager = PersonalizationManager()
+            return cls._personalization_manager
+    
+    @classmethod
+    def _get_rate_limiter(cls) -> RateLimiter:
+        """Get the process-wide rate limiter, creating it on first use"""
+        with cls._rate_limiter_lock:
+            if cls._rate_limiter is None:
+                cls._rate_limiter = RateLimiter(Config.MAX_CONCURRENCY,
+                                                Config.RATE_LIMIT_RPM,
+                                                Config.RATE_LIMIT_TPM)
+            return cls._rate_limiter
+    
+    @staticmethod
+    def _estimate_tokens(prompt: str, max_tokens: int = 1000) -> int:
+        """Rough token estimate for a request (about 4 characters per token plus the completion)"""
+        return len(prompt) // 4 + max_tokens
+    
+    @classmethod
+    def _get_http_client(cls):
+        """
+        Get the shared HTTP/2 client, creating it on first use
+        
+        Returns:
+            An httpx.Client with HTTP/2 enabled, or None if the h2 package is not
+            installed (the SDKs then use their default HTTP/1.1 client)
+        """
+        with cls._http_client_lock:
+            if cls._http_client is None:
+                try:
+                    import h2  # noqa: F401 - required by httpx for HTTP/2
+                    import httpx
+                except ImportError:
+                    logger.debug("h2 not installed, using default HTTP/1.1 API clients")
+                    return None
+                
+                cls._http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                    timeout=60.0,
+                )
+                atexit.register(cls._http_client.close)
+            return cls._http_client
+    
+    def _initialize_clients(self):
+        """Initialize API clients if keys are available"""
+        if not (Config.OPENAI_API_KEY or Config.ANTHROPIC_API_KEY):
+            return
+        
+        # Only pass http_client when HTTP/2 is available so the SDK defaults apply otherwise
+        http_client = self._get_http_client()
+        client_kwargs = {'http_client': http_client} if http_client is not None else {}
+        
+        # SDKs are imported here so code paths that never call an API skip their import cost
+        if Config.OPENAI_API_KEY:
+            from openai import OpenAI
+            self.openai_client = OpenAI(api_key=Config.OPENAI_API_KEY, **client_kwargs)
+        
+        if Config.ANTHROPIC_API_KEY:
+            from anthropic import Anthropic
+            self.anthropic_client = Anthropic(api_key=Config.ANTHROPIC_API_KEY, **client_kwargs)
+    
+    def generate_content(self, prompt: str, chatter_type: str, max_retries: int = None, 
+                        include_personalization: bool = True, include_rss: bool = True, include_web: bool = True) -> Optional[str]:
+        """
+        Generate content using the preferred provider with automatic failover
+        
+        Args:
+            prompt: The prompt to send to the AI model
+            chatter_type: Type of chatter (for logging purposes)
+            max_retries: Maximum number of retries per provider
+            include_personalization: Whether to include personalization context
+            include_rss: Whether to include RSS feed content
+            include_web: Whether to include web content
+            
+        Returns:
+            Generated content string or None if all providers fail
+        """
+        if max_retries is None:
+            max_retries = Config.MAX_RETRIES
+        
+        # If personalization is already included in the prompt, use it as-is
+        if not include_personalization:
+            enhanced_prompt = prompt
+        else:
+            # Legacy method - add personalization context to the top
+            personalization_context = self.personalization_manager.get_personalization_context(
+                include_rss=include_rss, include_web=include_web)
+            if personalization_context:
+                enhanced_prompt = f"{personalization_context}\n\n{prompt}"
+                logger.info(f"🎯 Enhanced prompt with personalization context for {chatter_type}")
+            else:
+                enhanced_prompt = prompt
+        
+        provider_order = Config.get_provider_order()
+        
+        for provider in provider_order:
+            logger.info(f"🔄 Trying {provider} for {chatter_type}")
+            
+            try:
+                if provider == 'OPENAI' and self.openai_client:
+                    content = self._generate_openai(enhanced_prompt, max_retries)
+                    if content:
+                        logger.info(f"✅ Successfully generated {chatter_type} content using OpenAI")
+                        return content
+                
+                elif provider == 'ANTHROPIC' and self.anthropic_client:
+                    content = self._generate_anthropic(enhanced_prompt, max_retries)
+                    if content:
+                        logger.info(f"✅ Successfully generated {chatter_type} content using Anthropic")
+                        return content
+                
+            except Exception as e:
+                logger.error(f"❌ {provider} failed for {chatter_type}: {str(e)}")
+                continue
+        
+        logger.error(f"❌ All providers failed for {chatter_type}")
+        return None
+    
+    def generate_content_multi(self, prompts: Dict[str, str], shared_context: str = '',
+                               max_retries: int = None) -> Dict[str, str]:
+        """
+        Generate content for several prompts with a single API request
+        
+        The shared context is sent once ahead of the tagged per-chatter prompts, so
+        the personalization guidelines, system prompt and request overhead are paid
+        once rather than once per chatter type.
+        
+        Args:
+            prompts: Mapping of chatter type to its chatter-specific prompt
+            shared_context: Context that applies to every prompt (e.g. personalization guidelines)
+            max_retries: Maximum number of retries per provider
+            
+        Returns:
+            Mapping of chatter type to generated content; chatter types missing from
+            the response are omitted so the caller can retry them on their own
+        """
+        if max_retries is None:
+            max_retries = Config.MAX_RETRIES
+        
+        if not prompts:
+            return {}
+        
+        tags = {chatter_type: re.sub(r'\W+', '_', chatter_type).upper() for chatter_type in prompts}
+        sections = '\n\n'.join(f"<<<{tags[chatter_type]}>>>\n{prompt.strip()}\n<<<END_{tags[chatter_type]}>>>"
+                                for chatter_type, prompt in prompts.items())
+        if shared_context:
+            combined_prompt = (f"The following guidelines apply to every request below:\n\n"
+                               f"{shared_context.strip()}\n\n{sections}")
+        else:
+            combined_prompt = sections
+        max_tokens = 1000 * len(prompts)
+        batch_label = ', '.join(prompts)
+        
+        response = None
+        for provider in Config.get_provider_order():
+            logger.info(f"🔄 Trying {provider} for batched request ({batch_label})")
+            
+            try:
+                if provider == 'OPENAI' and self.openai_client:
+                    response = self._generate_openai(combined_prompt, max_retries,
+                                                     MULTI_SYSTEM_PROMPT, max_tokens)
+                elif provider == 'ANTHROPIC' and self.anthropic_client:
+                    response = self._generate_anthropic(combined_prompt, max_retries,
+                                                        MULTI_SYSTEM_PROMPT, max_tokens)
+            except Exception as e:
+                logger.error(f"❌ {provider} failed for batched request: {str(e)}")
+                continue
+            
+            if response:
+                break
+        
+        if not response:
+            logger.error(f"❌ All providers failed for batched request ({batch_label})")
+            return {}
+        
+        results = {}
+        for chatter_type in prompts:
+            content = self._extract_section(response, tags[chatter_type])
+            if content:
+                logger.info(f"✅ Extracted {chatter_type} content from batched response")
+                results[chatter_type] = content
+            else:
+                logger.warning(f"⚠️ Batched response missing {chatter_type}")
+        
+        return results
+    
+    @staticmethod
+    def _extract_section(response: str, tag: str) -> Optional[str]:
+        """Extract the text between <<<TAG>>> and <<<END_TAG>>> markers"""
+        match = re.search(rf'<<<{tag}>>>\s*(.*?)\s*<<<END_{tag}>>>', response, re.DOTALL)
+        if match and match.group(1).strip():
+            return match.group(1).strip()
+        return None
+    
+    def _generate_openai(self, prompt: str, max_retries: int, system_prompt: str = SYSTEM_PROMPT,
+                         max_tokens: int = 1000) -> Optional[str]:
+        """Generate content using OpenAI API with retry logic"""
+        for attempt in range(max_retries):
+            try:
+                with self.rate_limiter.slot(self._estimate_tokens(prompt, max_tokens)):
+                    response = self.openai_client.chat.completions.create(
+                        model=Config.OPENAI_MODEL,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=max_tokens,
+                        temperature=0.8
+                    )
+                
+                content = response.choices[0].message.content.strip()
+                if content:
+                    return content
+                    
+            except Exception as e:
+                logger.warning(f"OpenAI attempt {attempt + 1} failed: {str(e)}")
+                if attempt < max_retries - 1:
+                    time.sleep(_retry_delay(e, attempt))
+        
+        return None
+    
+    def _generate_anthropic(self, prompt: str, max_retries: int, system_prompt: str = SYSTEM_PROMPT,
+                            max_tokens: int = 1000) -> Optional[str]:
+        """Generate content using Anthropic API with retry logic"""
+        for attempt in range(max_retries):
+            try:
+                with self.rate_limiter.slot(self._estimate_tokens(prompt, max_tokens)):
+                    response = self.anthropic_client.messages.create(
+                        model=Config.ANTHROPIC_MODEL,
+                        max_tokens=max_tokens,
+                        temperature=0.8,
+                        system=system_prompt,
+                        messages=[
+                            {"role": "user", "content": prompt}
+                        ]
+                    )
+                
+                content = response.content[0].text.strip()
+                if content:
+                    return content
+                    
+            except Exception as e:
+                logger.warning(f"Anthropic attempt {attempt + 1} failed: {str(e)}")
+                if attempt < max_retries - 1:
+                    time.sleep(_retry_delay(e, attempt))
+        
+        return None
+    
+    def test_connectivity(self) -> Dict[str, bool]:
+        """Test connectivity to both API providers"""
+        results = {}
+        
+        # Test OpenAI
+        if self.openai_client:
+            try:
+                response = self.openai_client.chat.completions.create(
+                    model=Config.OPENAI_MODEL,
+                    messages=[{"role": "user", "content": "Hello"}],
+                    max_tokens=10
+                )
+                results['OPENAI'] = True
+                logger.info("✅ OpenAI connectivity test passed")
+            except Exception as e:
+                results['OPENAI'] = False
+                logger.error(f"❌ OpenAI connectivity test failed: {str(e)}")
+        else:
+            results['OPENAI'] = False
+            logger.warning("⚠️ OpenAI client not initialized (missing API key)")
+        
+        # Test Anthropic
+        if self.anthropic_client:
+            try:
+                response = self.anthropic_client.messages.create(
+                    model=Config.ANTHROPIC_MODEL,
+                    max_tokens=10,
+                    messages=[{"role": "user", "content": "Hello"}]
+                )
+                results['ANTHROPIC'] = True
+                logger.info("✅ Anthropic connectivity test passed")
+            except Exception as e:
+                results['ANTHROPIC'] = False
+                logger.error(f"❌ Anthropic connectivity test failed: {str(e)}")
+        else:
+            results['ANTHROPIC'] = False
+            logger.warning("⚠️ Anthropic client not initialized (missing API key)")
+        
+        return results
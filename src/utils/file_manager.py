@@ -1,334 +1,476 @@
-"""
-File Manager module for EDCopilot Chit Chat Updater
-Handles file operations, backups, and content management
-"""
-
-import os
-import shutil
-import logging
-from datetime import datetime, timezone
-from typing import Optional, List, Dict
-from pathlib import Path
-from src.config import Config
-
-logger = logging.getLogger(__name__)
-
-class FileManager:
-    """File Manager for handling EDCopilot custom chatter files"""
-    
-    def __init__(self, debug_mode: bool = False):
-        self.debug_mode = debug_mode
-        self.custom_dir = Path(Config.CUSTOM_DIR)
-        self.backup_dir = Path("backups")
-        self.output_dir = Path("output")
-        self._ensure_directories()
-    
-    def _ensure_directories(self):
-        """Ensure all required directories exist"""
-        self.backup_dir.mkdir(exist_ok=True)
-        self.output_dir.mkdir(exist_ok=True)
-        
-        # Ensure custom directory exists if not in debug mode
-        if not self.debug_mode:
-            self.custom_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"📁 Custom directory ensured: {self.custom_dir}")
-        
-        logger.info(f"📁 Directories ensured: {self.backup_dir}, {self.output_dir}")
-    
-    def get_output_path(self, filename: str) -> Path:
-        """
-        Get the correct output path based on debug mode
-        
-        Args:
-            filename: Name of the file (e.g., 'EDCoPilot.ChitChat.Custom.txt')
-            
-        Returns:
-            Path to the output file
-        """
-        if self.debug_mode:
-            # In debug mode, write to project output directory
-            return self.output_dir / filename
-        else:
-            # In production mode, write to EDCopilot custom directory
-            return self.custom_dir / filename
-    
-    def get_chatter_files(self) -> Dict[str, Path]:
-        """Get the paths to all chatter files"""
-        files = {
-            'ChitChat': self.custom_dir / 'EDCoPilot.ChitChat.Custom.txt',
-            'SpaceChatter': self.custom_dir / 'EDCoPilot.SpaceChatter.Custom.txt',
-            'CrewChatter': self.custom_dir / 'EDCoPilot.CrewChatter.Custom.txt',
-            'DeepSpaceChatter': self.custom_dir / 'EDCoPilot.DeepSpaceChatter.Custom.txt'
-        }
-        
-        # Check which files exist
-        existing_files = {}
-        for name, path in files.items():
-            if path.exists():
-                existing_files[name] = path
-                logger.info(f"📄 Found existing file: {name} -> {path}")
-            else:
-                logger.warning(f"⚠️ File not found: {name} -> {path}")
-        
-        return existing_files
-    
-    def create_backup(self, file_path: Path) -> Optional[Path]:
-        """
-        Create a backup of the specified file
-        
-        Args:
-            file_path: Path to the file to backup
-            
-        Returns:
-            Path to the backup file or None if backup failed
-        """
-        if not file_path.exists():
-            logger.warning(f"⚠️ Cannot backup non-existent file: {file_path}")
-            return None
-        
-        try:
-            # Create timestamp for backup filename
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-            backup_path = self.backup_dir / backup_filename
-            
-            # Copy the file
-            shutil.copy2(file_path, backup_path)
-            logger.info(f"💾 Backup created: {file_path} -> {backup_path}")
-            return backup_path
-            
-        except Exception as e:
-            logger.error(f"❌ Backup failed for {file_path}: {str(e)}")
-            return None
-    
-    def create_backup_all(self) -> Dict[str, Optional[Path]]:
-        """Create backups of all existing chatter files"""
-        existing_files = self.get_chatter_files()
-        backups = {}
-        
-        for name, file_path in existing_files.items():
-            backup_path = self.create_backup(file_path)
-            backups[name] = backup_path
-        
-        return backups
-    
-    def read_file_content(self, file_path: Path) -> Optional[str]:
-        """Read content from a file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            logger.info(f"📖 Read {len(content)} characters from {file_path}")
-            return content
-        except Exception as e:
-            logger.error(f"❌ Failed to read {file_path}: {str(e)}")
-            return None
-    
-    def write_file_content(self, file_path: Path, content: str) -> bool:
-        """Write content to a file"""
-        try:
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            logger.info(f"📝 Wrote {len(content)} characters to {file_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to write {file_path}: {str(e)}")
-            return False
-    
-    def write_content(self, file_path: str, content: str) -> bool:
-        """
-        Write content to a file using a string path
-        
-        Args:
-            file_path: String path to the file
-            content: Content to write
-            
-        Returns:
-            True if successful
-        """
-        path = Path(file_path)
-        return self.write_file_content(path, content)
-    
-    def merge_content(self, file_path: str, new_content: str, max_lines: int = 100) -> bool:
-        """
-        Merge new content with existing content in a file
-        
-        Args:
-            file_path: String path to the file
-            new_content: New content to add
-            max_lines: Maximum number of lines to keep in total
-            
-        Returns:
-            True if successful
-        """
-        path = Path(file_path)
-        
-        # Create backup if file exists
-        if path.exists():
-            backup_path = self.create_backup(path)
-            if not backup_path:
-                logger.error(f"❌ Failed to create backup for {file_path}")
-                return False
-        
-        # Read existing content
-        existing_content = self.read_file_content(path) if path.exists() else ""
-        
-        # Merge content
-        merged_content = self._merge_content_strings(existing_content, new_content, max_lines)
-        
-        # Write merged content
-        return self.write_file_content(path, merged_content)
-    
-    def _merge_content_strings(self, existing_content: str, new_content: str, max_lines: int = 100) -> str:
-        """
-        Merge new content with existing content, avoiding duplicates
-        
-        Args:
-            existing_content: Current file content
-            new_content: New content to add
-            max_lines: Maximum number of lines to keep in total
-            
-        Returns:
-            Merged content string
-        """
-        # Split content into lines
-        existing_lines = [line.strip() for line in existing_content.split('\n') if line.strip()]
-        new_lines = [line.strip() for line in new_content.split('\n') if line.strip()]
-        
-        # Remove duplicates (case-insensitive)
-        existing_lower = set(line.lower() for line in existing_lines)
-        unique_new_lines = [line for line in new_lines if line.lower() not in existing_lower]
-        
-        # Combine and limit total lines
-        combined_lines = existing_lines + unique_new_lines
-        if len(combined_lines) > max_lines:
-            combined_lines = combined_lines[-max_lines:]  # Keep most recent
-        
-        # Join back into content
-        merged_content = '\n'.join(combined_lines)
-        
-        logger.info(f"🔄 Merged content: {len(existing_lines)} existing + {len(unique_new_lines)} new = {len(combined_lines)} total")
-        return merged_content
-    
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate content for basic quality checks
-        
-        Args:
-            content: Content to validate
-            
-        Returns:
-            True if content passes validation
-        """
-        if not content or not content.strip():
-            logger.warning("⚠️ Content is empty")
-            return False
-        
-        # Check for minimum content length
-        if len(content.strip()) < 50:
-            logger.warning("⚠️ Content too short")
-            return False
-        
-        # Check for inappropriate content (basic filter)
-        inappropriate_words = ['inappropriate', 'offensive', 'spam']
-        content_lower = content.lower()
-        for word in inappropriate_words:
-            if word in content_lower:
-                logger.warning(f"⚠️ Content contains inappropriate word: {word}")
-                return False
-        
-        logger.info("✅ Content validation passed")
-        return True
-    
-    def deploy_content(self, chatter_type: str, content: str) -> bool:
-        """
-        Deploy content to the appropriate EDCopilot file
-        
-        Args:
-            chatter_type: Type of chatter (ChitChat, SpaceChatter, etc.)
-            content: Content to deploy
-            
-        Returns:
-            True if deployment successful
-        """
-        # Create backup first
-        file_path = self.custom_dir / f'EDCoPilot.{chatter_type}.Custom.txt'
-        if file_path.exists():
-            backup_path = self.create_backup(file_path)
-            if not backup_path:
-                logger.error(f"❌ Failed to create backup for {chatter_type}")
-                return False
-        
-        # Validate content
-        if not self.validate_content(content):
-            logger.error(f"❌ Content validation failed for {chatter_type}")
-            return False
-        
-        # Write content
-        if self.write_file_content(file_path, content):
-            logger.info(f"✅ Successfully deployed {chatter_type} content")
-            return True
-        else:
-            logger.error(f"❌ Failed to deploy {chatter_type} content")
-            return False
-    
-    def rollback_file(self, chatter_type: str) -> bool:
-        """
-        Rollback a file to its most recent backup
-        
-        Args:
-            chatter_type: Type of chatter to rollback
-            
-        Returns:
-            True if rollback successful
-        """
-        file_path = self.custom_dir / f'EDCoPilot.{chatter_type}.Custom.txt'
-        
-        # Find most recent backup
-        backup_pattern = f"EDCoPilot.{chatter_type}_*"
-        backup_files = list(self.backup_dir.glob(backup_pattern))
-        
-        if not backup_files:
-            logger.warning(f"⚠️ No backups found for {chatter_type}")
-            return False
-        
-        # Get most recent backup
-        latest_backup = max(backup_files, key=lambda x: x.stat().st_mtime)
-        
-        try:
-            # Restore from backup
-            shutil.copy2(latest_backup, file_path)
-            logger.info(f"🔄 Rolled back {chatter_type} to {latest_backup}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Rollback failed for {chatter_type}: {str(e)}")
-            return False
-    
-    def get_file_info(self) -> Dict[str, Dict]:
-        """Get information about all chatter files"""
-        files = self.get_chatter_files()
-        info = {}
-        
-        for name, file_path in files.items():
-            try:
-                stat = file_path.stat()
-                content = self.read_file_content(file_path)
-                
-                info[name] = {
-                    'path': str(file_path),
-                    'size': stat.st_size,
-                    'modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
-                    'lines': len(content.split('\n')) if content else 0,
-                    'exists': True
-                }
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to get info for {name}: {str(e)}")
-                info[name] = {'exists': False, 'error': str(e)}
-        
-        return info
+"""
+File Manager module for EDCopilot Chit Chat Updater
+Handles file operations, backups, and content management
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import types
+import shutil
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, List, Dict
+from pathlib import Path
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Basic content filter, matched case-insensitively anywhere in the content in a single scan
+INAPPROPRIATE_WORDS = ['inappropriate', 'offensive', 'spam']
+_INAPPROPRIATE_WORD_RE = re.compile('|'.join(map(re.escape, INAPPROPRIATE_WORDS)), re.IGNORECASE)
+
+# Number of backups kept per chatter file; older ones are deleted as new backups are made
+MAX_BACKUPS_PER_FILE = 20
+
+CHATTER_TYPES = ('ChitChat', 'SpaceChatter', 'CrewChatter', 'DeepSpaceChatter')
+
+
+def temp_path_for(path: Path) -> Path:
+    """Temp file path for an atomic write to path, unique per thread so concurrent writers never share one"""
+    return path.with_name(f".{path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+
+
+class FileManager:
+    """File Manager for handling EDCopilot custom chatter files"""
+    
+    def __init__(self, debug_mode: bool = False):
+        self.debug_mode = debug_mode
+        self.custom_dir = Path(Config.CUSTOM_DIR)
+        # Chatter file paths are fixed for the lifetime of the manager
+        self._chatter_paths = types.MappingProxyType({
+            name: self.custom_dir / f'EDCoPilot.{name}.Custom.txt' for name in CHATTER_TYPES
+        })
+        self.backup_dir = Path("backups")
+        self.output_dir = Path("output")
+        self._backup_index_path = self.backup_dir / '.index.json'
+        self._backup_index_lock = threading.Lock()
+        # Existing chatter files and their stat results, reset whenever files change
+        self._chatter_files_cache: Optional[Dict[str, Path]] = None
+        self._chatter_stats: Dict[str, os.stat_result] = {}
+        self._ensure_directories()
+    
+    def _ensure_directories(self):
+        """Ensure all required directories exist"""
+        self.backup_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(exist_ok=True)
+        
+        # Ensure custom directory exists if not in debug mode
+        if not self.debug_mode:
+            self.custom_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"📁 Custom directory ensured: {self.custom_dir}")
+        
+        logger.info(f"📁 Directories ensured: {self.backup_dir}, {self.output_dir}")
+    
+    def get_output_path(self, filename: str) -> Path:
+        """
+        Get the correct output path based on debug mode
+        
+        Args:
+            filename: Name of the file (e.g., 'EDCoPilot.ChitChat.Custom.txt')
+            
+        Returns:
+            Path to the output file
+        """
+        if self.debug_mode:
+            # In debug mode, write to project output directory
+            return self.output_dir / filename
+        else:
+            # In production mode, write to EDCopilot custom directory
+            return self.custom_dir / filename
+    
+    def _invalidate_chatter_files_cache(self):
+        """Forget cached chatter file lookups after a file has been changed"""
+        self._chatter_files_cache = None
+        self._chatter_stats = {}
+    
+    def _chatter_path(self, chatter_type: str) -> Path:
+        """Get the custom file path for a chatter type"""
+        return self._chatter_paths.get(chatter_type) or self.custom_dir / f'EDCoPilot.{chatter_type}.Custom.txt'
+    
+    def get_chatter_files(self) -> Dict[str, Path]:
+        """Get the paths to all chatter files"""
+        if self._chatter_files_cache is not None:
+            return dict(self._chatter_files_cache)
+        
+        # Check which files exist (one stat per file, kept for get_file_info)
+        existing_files = {}
+        stats = {}
+        for name, path in self._chatter_paths.items():
+            try:
+                stats[name] = path.stat()
+            except FileNotFoundError:
+                logger.warning(f"⚠️ File not found: {name} -> {path}")
+                continue
+            existing_files[name] = path
+            logger.info(f"📄 Found existing file: {name} -> {path}")
+        
+        self._chatter_files_cache = existing_files
+        self._chatter_stats = stats
+        return dict(existing_files)
+    
+    def _backup_path_for(self, file_path: Path) -> Path:
+        """Get a timestamped backup path for the specified file"""
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        backup_path = self.backup_dir / f"{file_path.stem}_{timestamp}{file_path.suffix}"
+        
+        # Backups taken within the same second get a counter instead of overwriting each other
+        counter = 1
+        while backup_path.exists():
+            backup_path = self.backup_dir / f"{file_path.stem}_{timestamp}_{counter}{file_path.suffix}"
+            counter += 1
+        
+        return backup_path
+    
+    def _load_backup_index(self) -> Dict[str, List[Dict]]:
+        """Load the backup index ({resolved source path: [{'ts', 'path'}, ...]} in creation order)"""
+        try:
+            return json.loads(self._backup_index_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read backup index, starting a new one: {str(e)}")
+            return {}
+    
+    @staticmethod
+    def _backup_key(file_path: Path) -> str:
+        """Backup index key for a file; debug output and custom-dir files share a stem, so key by full path"""
+        return str(file_path.resolve())
+    
+    def _record_backup(self, file_path: Path, backup_path: Path):
+        """Add a backup to the index and delete the oldest backups beyond the retention limit"""
+        with self._backup_index_lock:
+            # Re-read on every update so FileManager instances sharing the directory don't drop each other's entries
+            index = self._load_backup_index()
+            entries = index.setdefault(self._backup_key(file_path), [])
+            entries.append({'ts': time.time(), 'path': str(backup_path)})
+            
+            expired = entries[:-MAX_BACKUPS_PER_FILE]
+            del entries[:-MAX_BACKUPS_PER_FILE]
+            for entry in expired:
+                Path(entry['path']).unlink(missing_ok=True)
+                logger.info(f"🗑️ Removed old backup: {entry['path']}")
+            
+            tmp_path = temp_path_for(self._backup_index_path)
+            try:
+                tmp_path.write_text(json.dumps(index, indent=2), encoding='utf-8')
+                os.replace(tmp_path, self._backup_index_path)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to update backup index: {str(e)}")
+                tmp_path.unlink(missing_ok=True)
+    
+    def _find_latest_backup(self, file_path: Path) -> Optional[Path]:
+        """Find the most recent backup of a file, preferring the backup index"""
+        index = self._load_backup_index()
+        for entry in reversed(index.get(self._backup_key(file_path), [])):
+            backup_path = Path(entry['path'])
+            if backup_path.exists():
+                return backup_path
+        
+        # Fall back to scanning for backups made before the index existed, skipping
+        # indexed backups of other files with the same name (e.g. debug output)
+        indexed = {Path(entry['path']).name for key, entries in index.items() if os.path.isabs(key)
+                   for entry in entries}
+        backup_files = [path for path in self.backup_dir.glob(f"{file_path.stem}_*{file_path.suffix}")
+                        if path.name not in indexed]
+        if not backup_files:
+            return None
+        return max(backup_files, key=lambda x: x.stat().st_mtime)
+    
+    def create_backup(self, file_path: Path) -> Optional[Path]:
+        """
+        Create a backup of the specified file
+        
+        Args:
+            file_path: Path to the file to backup
+            
+        Returns:
+            Path to the backup file or None if backup failed
+        """
+        if not file_path.exists():
+            logger.warning(f"⚠️ Cannot backup non-existent file: {file_path}")
+            return None
+        
+        try:
+            backup_path = self._backup_path_for(file_path)
+            
+            # Copy the file
+            shutil.copyfile(file_path, backup_path)
+            self._record_backup(file_path, backup_path)
+            logger.info(f"💾 Backup created: {file_path} -> {backup_path}")
+            return backup_path
+            
+        except Exception as e:
+            logger.error(f"❌ Backup failed for {file_path}: {str(e)}")
+            return None
+    
+    def create_backup_all(self) -> Dict[str, Optional[Path]]:
+        """Create backups of all existing chatter files"""
+        existing_files = self.get_chatter_files()
+        if not existing_files:
+            return {}
+        
+        # Copies of different files overlap their I/O when run in parallel
+        with ThreadPoolExecutor(max_workers=len(existing_files)) as executor:
+            futures = {name: executor.submit(self.create_backup, file_path)
+                       for name, file_path in existing_files.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    def _decode_text(data: bytes) -> str:
+        """Decode file bytes the way a text-mode read would (UTF-8, all line endings as \\n)"""
+        content = data.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def read_file_content(self, file_path: Path) -> Optional[str]:
+        """Read content from a file"""
+        try:
+            content = self._decode_text(file_path.read_bytes())
+            logger.info(f"📖 Read {len(content)} characters from {file_path}")
+            return content
+        except Exception as e:
+            logger.error(f"❌ Failed to read {file_path}: {str(e)}")
+            return None
+    
+    def write_file_content(self, file_path: Path, content: str) -> bool:
+        """Write content to a file atomically (temp file + rename)"""
+        tmp_path = temp_path_for(file_path)
+        try:
+            # Ensure parent directory exists
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Match text-mode writes, which emit the platform line separator
+            data = content if os.linesep == '\n' else content.replace('\n', os.linesep)
+            tmp_path.write_bytes(data.encode('utf-8'))
+            os.replace(tmp_path, file_path)
+            self._invalidate_chatter_files_cache()
+            
+            logger.info(f"📝 Wrote {len(content)} characters to {file_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to write {file_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+    
+    def write_content(self, file_path: str, content: str) -> bool:
+        """
+        Write content to a file using a string path
+        
+        Args:
+            file_path: String path to the file
+            content: Content to write
+            
+        Returns:
+            True if successful
+        """
+        path = Path(file_path)
+        return self.write_file_content(path, content)
+    
+    def merge_content(self, file_path: str, new_content: str, max_lines: int = 100) -> bool:
+        """
+        Merge new content with existing content in a file
+        
+        Args:
+            file_path: String path to the file
+            new_content: New content to add
+            max_lines: Maximum number of lines to keep in total
+            
+        Returns:
+            True if successful
+        """
+        path = Path(file_path)
+        
+        # Create backup if file exists
+        if path.exists():
+            backup_path = self.create_backup(path)
+            if not backup_path:
+                logger.error(f"❌ Failed to create backup for {file_path}")
+                return False
+        
+        # Merge content, streaming the existing file rather than loading it whole
+        return self._merge_content_streaming(path, new_content, path, max_lines)
+    
+    @staticmethod
+    def _line_key(line: str) -> bytes:
+        """Compact case-insensitive dedupe key for a line (8-byte digest instead of the full string)"""
+        return hashlib.blake2b(line.casefold().encode('utf-8'), digest_size=8).digest()
+    
+    def _merge_content_streaming(self, existing_path: Path, new_content: str, output_path: Path,
+                                 max_lines: int = 100) -> bool:
+        """
+        Merge new content with an existing file, avoiding duplicates
+        
+        The existing file is read line by line, so memory stays bounded by
+        max_lines plus one small digest per existing line.
+        
+        Args:
+            existing_path: File holding the current content (may not exist yet)
+            new_content: New content to add
+            output_path: File to write the merged content to
+            max_lines: Maximum number of lines to keep in total
+            
+        Returns:
+            True if successful
+        """
+        # Strip, skip blanks, drop new lines that already exist (case-insensitive)
+        # and keep only the most recent max_lines
+        existing_keys = set()
+        merged_lines = deque(maxlen=max_lines)
+        existing_count = new_count = 0
+        
+        try:
+            if existing_path.exists():
+                with open(existing_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            existing_keys.add(self._line_key(line))
+                            merged_lines.append(line)
+                            existing_count += 1
+        except Exception as e:
+            logger.error(f"❌ Failed to read {existing_path}: {str(e)}")
+            return False
+        
+        for line in new_content.splitlines():
+            line = line.strip()
+            if line and self._line_key(line) not in existing_keys:
+                merged_lines.append(line)
+                new_count += 1
+        
+        logger.info(f"🔄 Merged content: {existing_count} existing + {new_count} new = {len(merged_lines)} total")
+        return self.write_file_content(output_path, '\n'.join(merged_lines))
+    
+    def validate_content(self, content: str) -> bool:
+        """
+        Validate content for basic quality checks
+        
+        Args:
+            content: Content to validate
+            
+        Returns:
+            True if content passes validation
+        """
+        if not content:
+            logger.warning("⚠️ Content is empty")
+            return False
+        
+        # Check for minimum content length, rejecting short content before copying anything
+        stripped_length = len(content.strip()) if len(content) >= 50 else 0
+        if stripped_length < 50:
+            if content.isspace():
+                logger.warning("⚠️ Content is empty")
+            else:
+                logger.warning("⚠️ Content too short")
+            return False
+        
+        # Check for inappropriate content (basic filter)
+        match = _INAPPROPRIATE_WORD_RE.search(content)
+        if match:
+            logger.warning(f"⚠️ Content contains inappropriate word: {match.group(0).lower()}")
+            return False
+        
+        logger.info("✅ Content validation passed")
+        return True
+    
+    def deploy_content(self, chatter_type: str, content: str) -> bool:
+        """
+        Deploy content to the appropriate EDCopilot file
+        
+        Args:
+            chatter_type: Type of chatter (ChitChat, SpaceChatter, etc.)
+            content: Content to deploy
+            
+        Returns:
+            True if deployment successful
+        """
+        # Create backup first
+        file_path = self._chatter_path(chatter_type)
+        if file_path.exists():
+            backup_path = self.create_backup(file_path)
+            if not backup_path:
+                logger.error(f"❌ Failed to create backup for {chatter_type}")
+                return False
+        
+        # Validate content
+        if not self.validate_content(content):
+            logger.error(f"❌ Content validation failed for {chatter_type}")
+            return False
+        
+        # Write content
+        if self.write_file_content(file_path, content):
+            logger.info(f"✅ Successfully deployed {chatter_type} content")
+            return True
+        else:
+            logger.error(f"❌ Failed to deploy {chatter_type} content")
+            return False
+    
+    def rollback_file(self, chatter_type: str) -> bool:
+        """
+        Rollback a file to its most recent backup
+        
+        Args:
+            chatter_type: Type of chatter to rollback
+            
+        Returns:
+            True if rollback successful
+        """
+        file_path = self._chatter_path(chatter_type)
+        
+        # Find most recent backup
+        latest_backup = self._find_latest_backup(file_path)
+        
+        if not latest_backup:
+            logger.warning(f"⚠️ No backups found for {chatter_type}")
+            return False
+        
+        try:
+            # Restore from backup
+            shutil.copyfile(latest_backup, file_path)
+            self._invalidate_chatter_files_cache()
+            logger.info(f"🔄 Rolled back {chatter_type} to {latest_backup}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Rollback failed for {chatter_type}: {str(e)}")
+            return False
+    
+    def _count_lines(self, file_path: Path) -> int:
+        """Count lines in a file by scanning raw bytes for newlines (0 for an empty file)"""
+        newlines = 0
+        has_data = False
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                has_data = True
+                newlines += chunk.count(b'\n')
+        return newlines + 1 if has_data else 0
+    
+    def get_file_info(self) -> Dict[str, Dict]:
+        """Get information about all chatter files"""
+        files = self.get_chatter_files()
+        info = {}
+        
+        for name, file_path in files.items():
+            try:
+                stat = self._chatter_stats.get(name) or file_path.stat()
+                
+                info[name] = {
+                    'path': str(file_path),
+                    'size': stat.st_size,
+                    'modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                    'lines': self._count_lines(file_path),
+                    'exists': True
+                }
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to get info for {name}: {str(e)}")
+                info[name] = {'exists': False, 'error': str(e)}
+        
+        return info
@@ -1,515 +1,942 @@
-"""
-Personalization module for EDCopilot Chit Chat Updater
-Handles user-specific context and web searching capabilities
-"""
-
-import os
-import re
-import json
-import pickle
-import logging
-import requests
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
-from urllib.parse import urlparse
-import feedparser
-from datetime import datetime, timezone, timedelta
-
-logger = logging.getLogger(__name__)
-
-class PersonalizationManager:
-    """Manages personalization context and web searching"""
-    
-    def __init__(self, personalization_file: str = "personalization.md", cache_dir: str = "cache"):
-        self.personalization_file = Path(personalization_file)
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.context_data = {}
-        self.rss_feeds = []
-        self.web_content = {}
-        self.rss_cache = {}
-        self.cache_duration = timedelta(hours=8)  # Cache for 8 hours
-        self._load_personalization()
-    
-    def _load_personalization(self):
-        """Load personalization data from the markdown file"""
-        if not self.personalization_file.exists():
-            logger.warning(f"⚠️ Personalization file not found: {self.personalization_file}")
-            return
-        
-        try:
-            with open(self.personalization_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self._parse_personalization_content(content)
-            logger.info(f"✅ Loaded personalization data: {len(self.context_data)} items")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to load personalization file: {str(e)}")
-    
-    def _parse_personalization_content(self, content: str):
-        """Parse the personalization markdown content"""
-        lines = content.split('\n')
-        current_section = None
-        
-        # Define valid sections that we want to process
-        valid_sections = ['Data', 'Themes', 'RSS Feeds', 'Conversation Styles']
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            # Check for headers
-            if line.startswith('##'):
-                section_name = line.lstrip('##').strip()
-                # Only process valid sections
-                if section_name in valid_sections:
-                    current_section = section_name
-                    logger.info(f"📝 Processing section: {current_section}")
-                else:
-                    current_section = None
-                    logger.info(f"⏭️ Skipping section: {section_name}")
-                continue
-            
-            # Check for RSS feeds (only in RSS Feeds section)
-            if current_section == 'RSS Feeds' and 'rss' in line.lower() and 'http' in line:
-                feed_info = self._extract_rss_feed_info(line)
-                if feed_info:
-                    self.rss_feeds.append(feed_info)
-                    logger.info(f"📡 Found RSS feed: {feed_info['url']} (max entries: {feed_info.get('max_entries', 'all')})")
-            
-            # Store context data only for valid sections
-            if current_section and current_section in valid_sections and line:
-                if current_section not in self.context_data:
-                    self.context_data[current_section] = []
-                
-                # Strip any existing "- " prefix to avoid double-formatting
-                if line.startswith('- '):
-                    line = line[2:]  # Remove the "- " prefix
-                
-                self.context_data[current_section].append(line)
-    
-    def _extract_urls(self, text: str) -> List[str]:
-        """Extract URLs from text"""
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        return re.findall(url_pattern, text)
-    
-    def _extract_rss_feed_info(self, text: str) -> Optional[Dict[str, any]]:
-        """Extract RSS feed URL and optional entry limit from text"""
-        # Look for pattern like "[2] https://example.com/rss.xml" or just "https://example.com/rss.xml"
-        import re
-        
-        # Pattern to match [number] followed by URL
-        pattern = r'\[(\d+)\]\s*(https?://[^\s<>"{}|\\^`\[\]]+)'
-        match = re.search(pattern, text)
-        
-        if match:
-            max_entries = int(match.group(1))
-            url = match.group(2)
-            return {
-                'url': url,
-                'max_entries': max_entries
-            }
-        
-        # If no bracket pattern, just extract URL (no entry limit)
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        url_match = re.search(url_pattern, text)
-        
-        if url_match:
-            return {
-                'url': url_match.group(0),
-                'max_entries': None  # No limit specified
-            }
-        
-        return None
-    
-    def _get_cache_file_path(self, feed_url: str) -> Path:
-        """Get the cache file path for a feed URL"""
-        # Create a safe filename from the URL
-        safe_filename = re.sub(r'[^\w\-_.]', '_', feed_url)
-        return self.cache_dir / f"rss_cache_{safe_filename}.pkl"
-    
-    def _is_cache_valid(self, cache_file: Path) -> bool:
-        """Check if the cache file is still valid (within 8 hours)"""
-        if not cache_file.exists():
-            return False
-        
-        try:
-            # Check file modification time
-            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime, tz=timezone.utc)
-            now = datetime.now(timezone.utc)
-            age = now - mtime
-            
-            return age < self.cache_duration
-        except Exception as e:
-            logger.warning(f"⚠️ Error checking cache validity: {str(e)}")
-            return False
-    
-    def _load_cached_rss(self, feed_url: str) -> Optional[Dict]:
-        """Load RSS content from cache if valid"""
-        cache_file = self._get_cache_file_path(feed_url)
-        
-        if not self._is_cache_valid(cache_file):
-            return None
-        
-        try:
-            with open(cache_file, 'rb') as f:
-                cached_data = pickle.load(f)
-                logger.info(f"📡 Loaded RSS cache for {feed_url}")
-                return cached_data
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to load RSS cache for {feed_url}: {str(e)}")
-            return None
-    
-    def _save_rss_cache(self, feed_url: str, rss_data: Dict):
-        """Save RSS content to cache"""
-        cache_file = self._get_cache_file_path(feed_url)
-        
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(rss_data, f)
-                logger.info(f"📡 Saved RSS cache for {feed_url}")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to save RSS cache for {feed_url}: {str(e)}")
-    
-    def fetch_rss_content(self, default_max_entries: int = 10) -> Dict[str, List[Dict[str, str]]]:
-        """Fetch content from RSS feeds with caching"""
-        if not self.rss_feeds:
-            logger.info("📡 No RSS feeds configured")
-            return {}
-        
-        rss_content = {}
-        
-        for feed_info in self.rss_feeds:
-            feed_url = feed_info['url']
-            max_entries = feed_info.get('max_entries', default_max_entries)
-            
-            # Try to load from cache first
-            cached_data = self._load_cached_rss(feed_url)
-            
-            if cached_data:
-                # Use cached data, but respect the feed's entry limit
-                cached_entries = cached_data.get('entries', [])
-                if max_entries is not None:
-                    cached_entries = cached_entries[:max_entries]
-                rss_content[feed_url] = cached_entries
-                logger.info(f"📡 Using cached RSS data for {feed_url} ({len(rss_content[feed_url])} entries)")
-                continue
-            
-            # Fetch fresh data if cache is invalid or missing
-            try:
-                logger.info(f"📡 Fetching fresh RSS feed: {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                if feed.bozo:
-                    logger.warning(f"⚠️ RSS feed parsing warning: {feed.bozo_exception}")
-                
-                entries = []
-                # Use feed-specific max_entries if specified, otherwise use default
-                entry_limit = max_entries if max_entries is not None else default_max_entries
-                
-                for entry in feed.entries[:entry_limit]:
-                    title = getattr(entry, 'title', '')
-                    summary = getattr(entry, 'summary', '')
-                    published = getattr(entry, 'published', '')
-                    
-                    # Create structured entry data
-                    entry_data = {
-                        'title': title,
-                        'summary': summary,
-                        'published': published
-                    }
-                    
-                    entries.append(entry_data)
-                
-                if entries:
-                    rss_content[feed_url] = entries
-                    logger.info(f"✅ Fetched {len(entries)} entries from {feed_url}")
-                    
-                    # Save to cache
-                    cache_data = {
-                        'entries': entries,
-                        'fetched_at': datetime.now(timezone.utc),
-                        'max_entries': entry_limit
-                    }
-                    self._save_rss_cache(feed_url, cache_data)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to fetch RSS feed {feed_url}: {str(e)}")
-        
-        return rss_content
-    
-    def fetch_web_content(self, urls: List[str], max_content_length: int = 1000) -> Dict[str, str]:
-        """Fetch content from web URLs"""
-        web_content = {}
-        
-        for url in urls:
-            try:
-                logger.info(f"🌐 Fetching web content: {url}")
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                
-                # Extract text content (basic implementation)
-                content = self._extract_text_content(response.text)
-                
-                if content:
-                    # Truncate if too long
-                    if len(content) > max_content_length:
-                        content = content[:max_content_length] + "..."
-                    
-                    web_content[url] = content
-                    logger.info(f"✅ Fetched {len(content)} characters from {url}")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to fetch web content {url}: {str(e)}")
-        
-        return web_content
-    
-    def _extract_text_content(self, html_content: str) -> str:
-        """Extract text content from HTML (basic implementation)"""
-        # Remove HTML tags
-        import re
-        text = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove common HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        
-        return text.strip()
-    
-    def get_personalization_context(self, include_rss: bool = True, include_web: bool = True) -> str:
-        """Get formatted personalization context for API calls"""
-        context_parts = []
-        
-        # Add basic context data
-        if self.context_data:
-            context_parts.append("## Personal Context:")
-            for section, items in self.context_data.items():
-                context_parts.append(f"### {section}:")
-                for item in items:
-                    context_parts.append(f"- {item}")
-                context_parts.append("")
-        
-        # Add RSS content if requested
-        if include_rss and self.rss_feeds:
-            rss_content = self.fetch_rss_content()
-            if rss_content:
-                context_parts.append("## Recent News and Updates:")
-                for feed_url, entries in rss_content.items():
-                    # Find the feed info to show entry limit
-                    feed_info = next((f for f in self.rss_feeds if f['url'] == feed_url), None)
-                    entry_limit = feed_info.get('max_entries', 'all') if feed_info else 'all'
-                    context_parts.append(f"### From {feed_url} (max {entry_limit} entries):")
-                    
-                    for entry in entries:
-                        # Title outside code block
-                        title = entry.get('title', '')
-                        summary = entry.get('summary', '')
-                        published = entry.get('published', '')
-                        
-                        context_parts.append(f"**{title}**")
-                        
-                        # Content inside code block
-                        content_parts = []
-                        if summary:
-                            content_parts.append(summary)
-                        if published:
-                            content_parts.append(f"Published: {published}")
-                        
-                        if content_parts:
-                            context_parts.append("```")
-                            context_parts.append("\n".join(content_parts))
-                            context_parts.append("```")
-                        
-                        context_parts.append("")
-        
-        # Add web content if requested
-        if include_web:
-            # Extract URLs from context data, excluding RSS feed URLs
-            all_urls = []
-            rss_urls = [feed_info['url'] for feed_info in self.rss_feeds]
-            
-            for section, items in self.context_data.items():
-                for item in items:
-                    urls = self._extract_urls(item)
-                    # Filter out RSS feed URLs to avoid duplicate fetching
-                    for url in urls:
-                        if url not in rss_urls:
-                            all_urls.append(url)
-            
-            if all_urls:
-                web_content = self.fetch_web_content(all_urls)
-                if web_content:
-                    context_parts.append("## Web Content References:")
-                    for url, content in web_content.items():
-                        context_parts.append(f"### {url}:")
-                        context_parts.append(content)
-                        context_parts.append("")
-        
-        return "\n".join(context_parts)
-    
-    def get_data_section(self) -> str:
-        """Get formatted data section for template variables"""
-        if 'Data' in self.context_data:
-            items = self.context_data['Data']
-            return '\n'.join([f"- {item}" for item in items])
-        return ""
-    
-    def get_themes_section(self) -> str:
-        """Get formatted themes section for template variables"""
-        if 'Themes' in self.context_data:
-            items = self.context_data['Themes']
-            # Always add "- " prefix since we strip it during parsing
-            return '\n'.join([f"- {item}" for item in items])
-        return ""
-    
-    def get_conversation_styles_section(self) -> str:
-        """Get formatted conversation styles section for template variables"""
-        if 'Conversation Styles' in self.context_data:
-            items = self.context_data['Conversation Styles']
-            # Always add "- " prefix since we strip it during parsing
-            return '\n'.join([f"- {item}" for item in items])
-        return ""
-    
-    def get_rss_summary(self) -> str:
-        """Get formatted RSS summary for template variables"""
-        if not self.rss_feeds:
-            return ""
-        
-        rss_content = self.fetch_rss_content()
-        if not rss_content:
-            return ""
-        
-        summary_parts = []
-        for feed_url, entries in rss_content.items():
-            feed_info = next((f for f in self.rss_feeds if f['url'] == feed_url), None)
-            entry_limit = feed_info.get('max_entries', 'all') if feed_info else 'all'
-            summary_parts.append(f"### From {feed_url} (max {entry_limit} entries):")
-            
-            for entry in entries:
-                # Title outside code block
-                title = entry.get('title', '')
-                summary = entry.get('summary', '')
-                published = entry.get('published', '')
-                
-                summary_parts.append(f"**{title}**")
-                
-                # Content inside code block
-                content_parts = []
-                if summary:
-                    content_parts.append(summary)
-                if published:
-                    content_parts.append(f"Published: {published}")
-                
-                if content_parts:
-                    summary_parts.append("```")
-                    summary_parts.append("\n".join(content_parts))
-                    summary_parts.append("```")
-                
-                summary_parts.append("")
-        
-        return '\n'.join(summary_parts)
-    
-    def get_user_preferences(self) -> Dict[str, any]:
-        """Extract user preferences from context data"""
-        preferences = {}
-        
-        # Extract specific data points
-        for section, items in self.context_data.items():
-            section_lower = section.lower()
-            
-            if 'commander' in section_lower or 'name' in section_lower:
-                for item in items:
-                    if ':' in item:
-                        key, value = item.split(':', 1)
-                        preferences[key.strip()] = value.strip()
-            
-            elif 'squadron' in section_lower:
-                for item in items:
-                    if ':' in item:
-                        key, value = item.split(':', 1)
-                        preferences[key.strip()] = value.strip()
-            
-            elif 'theme' in section_lower:
-                themes = []
-                for item in items:
-                    if item.startswith('-'):
-                        themes.append(item[1:].strip())
-                    else:
-                        themes.append(item)
-                preferences['themes'] = themes
-            
-            elif 'fleet' in section_lower and 'carrier' in section_lower:
-                for item in items:
-                    if ':' in item:
-                        key, value = item.split(':', 1)
-                        preferences[key.strip()] = value.strip()
-        
-        return preferences
-    
-    def get_content_guidelines(self) -> List[str]:
-        """Extract content guidelines and preferences"""
-        guidelines = []
-        
-        for section, items in self.context_data.items():
-            section_lower = section.lower()
-            
-            if 'notes' in section_lower or 'guidelines' in section_lower or 'preferences' in section_lower:
-                for item in items:
-                    if item.startswith('-'):
-                        guidelines.append(item[1:].strip())
-                    else:
-                        guidelines.append(item)
-        
-        return guidelines
-    
-    def clear_rss_cache(self, feed_url: Optional[str] = None):
-        """Clear RSS cache for a specific feed or all feeds"""
-        if feed_url:
-            # Clear cache for specific feed
-            cache_file = self._get_cache_file_path(feed_url)
-            if cache_file.exists():
-                cache_file.unlink()
-                logger.info(f"🗑️ Cleared RSS cache for {feed_url}")
-        else:
-            # Clear all RSS cache files
-            cache_files = list(self.cache_dir.glob("rss_cache_*.pkl"))
-            for cache_file in cache_files:
-                cache_file.unlink()
-            logger.info(f"🗑️ Cleared all RSS cache files ({len(cache_files)} files)")
-    
-    def get_cache_info(self) -> Dict[str, any]:
-        """Get information about the RSS cache"""
-        cache_info = {
-            'cache_dir': str(self.cache_dir),
-            'cache_duration_hours': self.cache_duration.total_seconds() / 3600,
-            'cached_feeds': []
-        }
-        
-        cache_files = list(self.cache_dir.glob("rss_cache_*.pkl"))
-        for cache_file in cache_files:
-            if self._is_cache_valid(cache_file):
-                mtime = datetime.fromtimestamp(cache_file.stat().st_mtime, tz=timezone.utc)
-                age = datetime.now(timezone.utc) - mtime
-                cache_info['cached_feeds'].append({
-                    'file': cache_file.name,
-                    'age_hours': age.total_seconds() / 3600,
-                    'valid': True
-                })
-            else:
-                cache_info['cached_feeds'].append({
-                    'file': cache_file.name,
-                    'age_hours': None,
-                    'valid': False
-                })
-        
-        return cache_info
+"""
+Personalization module for EDCopilot Chit Chat Updater
+Handles user-specific context and web searching capabilities
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import itertools
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from html import unescape
+from urllib.parse import urlparse
+import feedparser
+from datetime import datetime, timezone, timedelta
+from src.utils.file_manager import temp_path_for
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding for the RSS cache
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # Optional: fast HTML-to-text extraction
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml.html  # Optional: HTML parser used when selectolax is not installed, and fast RSS/Atom parsing
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data: bytes):
+    """Decode JSON, using orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(payload) -> bytes:
+    """Encode JSON as UTF-8 bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+# Precompiled patterns for URL extraction and HTML cleanup.
+# URLs are anchored on a word boundary and capped at 2048 characters so long
+# single-line input cannot cause runaway matching.
+_URL_RE = re.compile(r'\bhttps?://[^\s<>"{}|\\^`\[\]]{1,2048}')
+_BRACKET_URL_RE = re.compile(r'\[(\d+)\]\s*(https?://[^\s<>"{}|\\^`\[\]]{1,2048})')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Personalization sections that we want to process
+VALID_SECTIONS = frozenset({'Data', 'Themes', 'RSS Feeds', 'Conversation Styles'})
+
+# Atom and RSS content-module namespace prefixes for ElementTree-style tag lookups
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_RSS_CONTENT_NS = '{http://purl.org/rss/1.0/modules/content/}'
+
+# Longest RSS entry summary kept in the cache and prompt context
+MAX_SUMMARY_LENGTH = 2000
+
+# Separate connect and read timeouts (seconds) for feed and web requests
+HTTP_TIMEOUT = (3, 10)
+
+# Upper bound on bytes read from a web page; only the first max_content_length characters are kept anyway
+MAX_WEB_RESPONSE_BYTES = 1024 * 1024
+
+class PersonalizationManager:
+    """Manages personalization context and web searching"""
+    
+    # Process-wide per-cache-file locks, so concurrent fetches of one URL are coalesced across instances
+    _fetch_locks: Dict[str, threading.Lock] = {}
+    _fetch_locks_guard = threading.Lock()
+    
+    def __init__(self, personalization_file: str = "personalization.md", cache_dir: str = "cache"):
+        self.personalization_file = Path(personalization_file)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.context_data = {}
+        self.rss_feeds = []
+        self._rss_feeds_by_url = {}
+        self._web_urls: List[str] = []
+        self.web_content = {}
+        self.rss_cache = {}
+        self._cache_paths: Dict[str, Path] = {}
+        
+        # In-memory copy of the RSS cache: feed URL -> (fetch timestamp, cached data)
+        self._mem_cache: Dict[str, Tuple[float, Dict]] = {}
+        self.cache_duration = timedelta(hours=8)  # Cache for 8 hours
+        self._cache_duration_s = self.cache_duration.total_seconds()
+        
+        # Memoized getter results, stamped with the file/cache mtimes they were built from
+        self._context_cache: Dict[Tuple, Tuple[Tuple, Any]] = {}
+        self._loaded_mtime: Optional[float] = None
+        
+        # Pooled session so repeated hosts reuse their connections across fetches
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self._http_session.mount('http://', adapter)
+        self._http_session.mount('https://', adapter)
+        self._load_personalization()
+    
+    def _load_personalization(self):
+        """Load personalization data from the markdown file"""
+        self._context_cache.clear()
+        self._loaded_mtime = self._get_personalization_mtime()
+        
+        if self._loaded_mtime is None:
+            logger.warning(f"⚠️ Personalization file not found: {self.personalization_file}")
+            return
+        
+        try:
+            with open(self.personalization_file, 'r', encoding='utf-8') as f:
+                self._parse_personalization_lines(f)
+            
+            logger.info(f"✅ Loaded personalization data: {len(self.context_data)} items")
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to load personalization file: {str(e)}")
+    
+    def _get_personalization_mtime(self) -> Optional[float]:
+        """Modification time of the personalization file, or None if it does not exist"""
+        try:
+            return self.personalization_file.stat().st_mtime
+        except OSError:
+            return None
+    
+    def _reload_if_changed(self):
+        """Reload personalization data if the file changed since it was last loaded"""
+        if self._get_personalization_mtime() != self._loaded_mtime:
+            self.context_data = {}
+            self.rss_feeds = []
+            self._rss_feeds_by_url = {}
+            self._web_urls = []
+            self._load_personalization()
+    
+    def _get_rss_cache_stamp(self) -> Tuple[Optional[float], ...]:
+        """Per-feed cache file mtime, or None for feeds whose cache is missing or expired"""
+        # One stat per feed; this runs on every RSS-backed getter call
+        oldest_valid = time.time() - self._cache_duration_s
+        stamp = []
+        for feed_url in self._rss_feeds_by_url:
+            try:
+                mtime = self._get_cache_file_path(feed_url).stat().st_mtime
+            except OSError:
+                mtime = None
+            stamp.append(mtime if mtime is not None and mtime > oldest_valid else None)
+        return tuple(stamp)
+    
+    def _cached(self, key: Tuple, build: Callable[[], Any], uses_rss: bool = False) -> Any:
+        """
+        Return a memoized value derived from the personalization data, rebuilding it when its inputs change
+        
+        Args:
+            key: Cache key (getter name plus arguments)
+            build: Builds the value on a cache miss
+            uses_rss: Whether the value includes RSS content, so expired or
+                refreshed feed caches also invalidate it
+            
+        Returns:
+            The memoized value
+        """
+        self._reload_if_changed()
+        
+        # A failing feed keeps a None slot in the stamp, so it is only retried once another cache changes or expires
+        cached = self._context_cache.get(key)
+        if cached and cached[0] == (self._loaded_mtime, self._get_rss_cache_stamp() if uses_rss else None):
+            return cached[1]
+        
+        value = build()
+        
+        # Stamp after building, since building may have refreshed the feed caches
+        stamp = (self._loaded_mtime, self._get_rss_cache_stamp() if uses_rss else None)
+        self._context_cache[key] = (stamp, value)
+        return value
+    
+    def _parse_personalization_lines(self, lines: Iterable[str]):
+        """Parse the personalization markdown content one line at a time"""
+        current_section = None
+        context_urls = []
+        
+        for line in lines:
+            line = line.strip()
+            
+            # Skip empty lines
+            if not line:
+                continue
+            
+            # Check for headers
+            if line.startswith('##'):
+                section_name = line.lstrip('#').strip()
+                # Only process valid sections
+                if section_name in VALID_SECTIONS:
+                    current_section = section_name
+                    logger.info(f"📝 Processing section: {current_section}")
+                else:
+                    current_section = None
+                    logger.info(f"⏭️ Skipping section: {section_name}")
+                continue
+            
+            # Check for RSS feeds (only in RSS Feeds section)
+            if current_section == 'RSS Feeds' and 'http' in line and 'rss' in line.lower():
+                feed_info = self._extract_rss_feed_info(line)
+                if feed_info and feed_info['url'] in self._rss_feeds_by_url:
+                    logger.info(f"⏭️ Skipping duplicate RSS feed: {feed_info['url']}")
+                elif feed_info:
+                    self.rss_feeds.append(feed_info)
+                    self._rss_feeds_by_url[feed_info['url']] = feed_info
+                    logger.info(f"📡 Found RSS feed: {feed_info['url']} (max entries: {feed_info.get('max_entries', 'all')})")
+            
+            # Store context data only for valid sections (current_section is only ever set to one)
+            if current_section:
+                # Strip any existing "- " prefix to avoid double-formatting
+                if line.startswith('- '):
+                    line = line[2:]  # Remove the "- " prefix
+                
+                self.context_data.setdefault(current_section, []).append(line)
+                context_urls.extend(self._extract_urls(line))
+        
+        # Web pages referenced by the context, excluding RSS feeds to avoid duplicate fetching
+        self._web_urls = [url for url in dict.fromkeys(context_urls) if url not in self._rss_feeds_by_url]
+    
+    def _extract_urls(self, text: str) -> List[str]:
+        """Extract URLs from text"""
+        # Most lines have no URL at all; a substring check is far cheaper than the regex scan
+        if 'http' not in text:
+            return []
+        return _URL_RE.findall(text)
+    
+    def _extract_rss_feed_info(self, text: str) -> Optional[Dict[str, any]]:
+        """Extract RSS feed URL and optional entry limit from text"""
+        # Look for pattern like "[2] https://example.com/rss.xml" or just "https://example.com/rss.xml"
+        match = _BRACKET_URL_RE.search(text) if '[' in text else None
+        
+        if match:
+            max_entries = int(match.group(1))
+            url = match.group(2)
+            return {
+                'url': url,
+                'max_entries': max_entries
+            }
+        
+        # If no bracket pattern, just extract URL (no entry limit)
+        url_match = _URL_RE.search(text)
+        
+        if url_match:
+            return {
+                'url': url_match.group(0),
+                'max_entries': None  # No limit specified
+            }
+        
+        return None
+    
+    def _get_cache_file_path(self, feed_url: str) -> Path:
+        """Get the cache file path for a feed URL"""
+        cache_file = self._cache_paths.get(feed_url)
+        if cache_file is None:
+            # Hash the URL for a short, collision-safe filename; the URL itself is stored in the payload
+            digest = hashlib.blake2b(feed_url.encode('utf-8'), digest_size=16).hexdigest()
+            cache_file = self._cache_paths[feed_url] = self.cache_dir / f"rss_cache_{digest}.json"
+        return cache_file
+    
+    def _read_rss_cache_file(self, feed_url: str, max_age: Optional[float] = None) -> Optional[Tuple[float, Dict]]:
+        """
+        Read a feed's cache file with a single open and fstat
+        
+        Args:
+            feed_url: URL of the RSS feed
+            max_age: Maximum age in seconds, or None to ignore the file's age
+            
+        Returns:
+            Tuple of (file mtime, cached data), or None if missing, too old or unreadable
+        """
+        cache_file = self._get_cache_file_path(feed_url)
+        
+        try:
+            f = open(cache_file, 'rb')
+        except FileNotFoundError:
+            return None
+        
+        try:
+            with f:
+                mtime = os.fstat(f.fileno()).st_mtime
+                if max_age is not None and time.time() - mtime >= max_age:
+                    return None
+                rss_data = _json_loads(f.read())
+            if rss_data.get('fetched_at'):
+                rss_data['fetched_at'] = datetime.fromisoformat(rss_data['fetched_at'])
+            return mtime, rss_data
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load RSS cache for {feed_url}: {str(e)}")
+            return None
+    
+    def _read_rss_cache(self, feed_url: str) -> Optional[Dict]:
+        """Read cached RSS content regardless of its age"""
+        cached = self._read_rss_cache_file(feed_url)
+        return cached[1] if cached else None
+    
+    def _load_cached_rss(self, feed_url: str) -> Optional[Dict]:
+        """Load RSS content from cache if valid, checking memory before disk"""
+        max_age = self._cache_duration_s
+        
+        mem_entry = self._mem_cache.get(feed_url)
+        if mem_entry and time.time() - mem_entry[0] < max_age:
+            return mem_entry[1]
+        
+        cached = self._read_rss_cache_file(feed_url, max_age)
+        if not cached:
+            return None
+        
+        # Age the memory copy from the file's timestamp so both expire together
+        self._mem_cache[feed_url] = cached
+        logger.info(f"📡 Loaded RSS cache for {feed_url}")
+        return cached[1]
+    
+    def _save_rss_cache(self, feed_url: str, rss_data: Dict):
+        """Save RSS content to cache"""
+        cache_file = self._get_cache_file_path(feed_url)
+        
+        # Store the timestamp as ISO 8601 so the cache stays plain JSON
+        payload = dict(rss_data)
+        if isinstance(payload.get('fetched_at'), datetime):
+            payload['fetched_at'] = payload['fetched_at'].isoformat()
+        
+        try:
+            self._write_cache_file(cache_file, _json_dumps(payload))
+            self._mem_cache[feed_url] = (time.time(), rss_data)
+            logger.info(f"📡 Saved RSS cache for {feed_url}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to save RSS cache for {feed_url}: {str(e)}")
+    
+    @staticmethod
+    def _write_cache_file(cache_file: Path, data: bytes):
+        """Write a cache file atomically so readers never see a partial file"""
+        # Write to a per-thread temp file and rename it into place
+        tmp_file = temp_path_for(cache_file)
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+    
+    def fetch_rss_content(self, default_max_entries: int = 10) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Fetch content from RSS feeds with caching
+        
+        Args:
+            default_max_entries: Entry limit for feeds that do not specify one
+            
+        Returns:
+            Dictionary mapping feed URLs to their entries
+        """
+        if not self.rss_feeds:
+            logger.info("📡 No RSS feeds configured")
+            return {}
+        
+        fetched = {}
+        misses = {}
+        
+        # Serve cache hits first; only the misses need a network round trip
+        for feed_info in self.rss_feeds:
+            feed_url = feed_info['url']
+            max_entries = feed_info.get('max_entries', default_max_entries)
+            
+            # Try to load from cache first
+            cached_data = self._load_cached_rss(feed_url)
+            
+            if cached_data:
+                # Use cached data, but respect the feed's entry limit
+                cached_entries = cached_data.get('entries', [])
+                if max_entries is not None:
+                    cached_entries = cached_entries[:max_entries]
+                fetched[feed_url] = cached_entries
+                logger.info(f"📡 Using cached RSS data for {feed_url} ({len(cached_entries)} entries)")
+                continue
+            
+            # Use feed-specific max_entries if specified, otherwise use default
+            misses[feed_url] = max_entries if max_entries is not None else default_max_entries
+        
+        # Fetch fresh data for invalid or missing caches in parallel
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+                for feed_url, entries in zip(misses, executor.map(self._fetch_one, misses, misses.values())):
+                    if entries:
+                        fetched[feed_url] = entries
+        
+        # Keep the configured feed order regardless of completion order
+        return {feed_info['url']: fetched[feed_info['url']]
+                for feed_info in self.rss_feeds if feed_info['url'] in fetched}
+    
+    @classmethod
+    def _lock_for(cls, cache_file: Path) -> threading.Lock:
+        """Get the process-wide fetch lock for a cache file, creating it on first use"""
+        key = os.path.abspath(cache_file)
+        with cls._fetch_locks_guard:
+            lock = cls._fetch_locks.get(key)
+            if lock is None:
+                lock = cls._fetch_locks[key] = threading.Lock()
+            return lock
+    
+    def _fetch_one(self, feed_url: str, entry_limit: int) -> Optional[List[Dict[str, str]]]:
+        """Fetch one feed and update its cache (runs on a worker thread; cache writes are atomic)"""
+        with self._lock_for(self._get_cache_file_path(feed_url)):
+            # Another caller may have refreshed the cache while we waited for the lock
+            cached_data = self._load_cached_rss(feed_url)
+            if cached_data:
+                logger.info(f"📡 Using RSS data refreshed by a concurrent fetch for {feed_url}")
+                return cached_data.get('entries', [])[:entry_limit]
+            
+            return self._fetch_and_cache(feed_url, entry_limit)
+    
+    def _fetch_and_cache(self, feed_url: str, entry_limit: int) -> Optional[List[Dict[str, str]]]:
+        """Fetch one feed and save its cache, logging any failure"""
+        try:
+            entries, cache_data = self._fetch_rss_entries(feed_url, entry_limit)
+            
+            if cache_data:
+                self._save_rss_cache(feed_url, cache_data)
+            
+            if entries:
+                logger.info(f"✅ Fetched {len(entries)} entries from {feed_url}")
+            return entries
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch RSS feed {feed_url}: {str(e)}")
+            return None
+    
+    def _fetch_rss_entries(self, feed_url: str, entry_limit: int) -> Tuple[List[Dict[str, str]], Optional[Dict]]:
+        """
+        Fetch and parse an RSS feed, revalidating any expired cache entry
+        
+        Expired cache entries are revalidated with a conditional GET using the
+        saved ETag/Last-Modified headers. A 304 response, or a body whose hash
+        matches the cached one, refreshes the cache timestamp and reuses the
+        cached entries without re-parsing the feed.
+        
+        Safe to call from worker threads; the caller saves the returned cache data.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            entry_limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (entry dictionaries with title, summary, published;
+            cache data to save, or None if the cache is already current)
+        """
+        cache_file = self._get_cache_file_path(feed_url)
+        stale_data = self._read_rss_cache(feed_url) or {}
+        
+        # Cached entries can only be reused if they cover the requested limit
+        can_reuse = bool(stale_data.get('entries')) and (stale_data.get('max_entries') or 0) >= entry_limit
+        
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        if can_reuse:
+            if stale_data.get('etag'):
+                headers['If-None-Match'] = stale_data['etag']
+            if stale_data.get('last_modified'):
+                headers['If-Modified-Since'] = stale_data['last_modified']
+        
+        logger.info(f"📡 Fetching fresh RSS feed: {feed_url}")
+        response = self._http_session.get(feed_url, headers=headers, timeout=HTTP_TIMEOUT)
+        
+        if response.status_code == 304 and can_reuse:
+            cache_file.touch()
+            logger.info(f"📡 RSS feed not modified, reusing cached entries for {feed_url}")
+            return stale_data['entries'][:entry_limit], None
+        
+        response.raise_for_status()
+        
+        content_hash = hashlib.blake2b(response.content, digest_size=8).hexdigest()
+        if can_reuse and stale_data.get('content_hash') == content_hash:
+            cache_file.touch()
+            logger.info(f"📡 RSS feed unchanged, reusing cached entries for {feed_url}")
+            return stale_data['entries'][:entry_limit], None
+        
+        entries = self._parse_feed_xml(response.content, entry_limit)
+        if entries is None:
+            entries = self._parse_feed_with_feedparser(response, entry_limit)
+        
+        if not entries:
+            return entries, None
+        
+        # Cache along with the validators needed for the next revalidation
+        cache_data = {
+            'url': feed_url,
+            'entries': entries,
+            'fetched_at': datetime.now(timezone.utc),
+            'max_entries': entry_limit,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash
+        }
+        return entries, cache_data
+    
+    @staticmethod
+    def _parse_feed_xml(content: bytes, entry_limit: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Parse a well-formed RSS 2.0 or Atom feed with lxml, stopping after entry_limit entries
+        
+        Returns:
+            Entry dictionaries, or None if lxml is unavailable or the feed needs
+            feedparser (malformed XML or an unrecognized feed format)
+        """
+        if lxml_etree is None:
+            return None
+        
+        try:
+            # Feeds are untrusted input: never resolve entities or fetch external resources
+            parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+            root = lxml_etree.fromstring(content, parser=parser)
+        except (ValueError, lxml_etree.XMLSyntaxError):
+            return None
+        
+        def text_of(element, *tags: str) -> str:
+            for tag in tags:
+                child = element.find(tag)
+                if child is not None:
+                    return ''.join(child.itertext()).strip()
+            return ''
+        
+        items = list(itertools.islice(root.iter('item'), entry_limit))
+        if items:
+            return [{
+                'title': text_of(item, 'title'),
+                'summary': text_of(item, 'description', f'{_RSS_CONTENT_NS}encoded')[:MAX_SUMMARY_LENGTH],
+                'published': text_of(item, 'pubDate')
+            } for item in items]
+        
+        items = list(itertools.islice(root.iter(f'{_ATOM_NS}entry'), entry_limit))
+        if items:
+            return [{
+                'title': text_of(item, f'{_ATOM_NS}title'),
+                'summary': text_of(item, f'{_ATOM_NS}summary', f'{_ATOM_NS}content')[:MAX_SUMMARY_LENGTH],
+                'published': text_of(item, f'{_ATOM_NS}published')
+            } for item in items]
+        
+        return None
+    
+    @staticmethod
+    def _parse_feed_with_feedparser(response: requests.Response, entry_limit: int) -> List[Dict[str, str]]:
+        """Parse a feed with feedparser, which tolerates malformed XML and older feed formats"""
+        feed = feedparser.parse(response.content,
+                                response_headers={k.lower(): v for k, v in response.headers.items()})
+        
+        if feed.bozo:
+            logger.warning(f"⚠️ RSS feed parsing warning: {feed.bozo_exception}")
+        
+        entries = []
+        for entry in feed.entries[:entry_limit]:
+            title = getattr(entry, 'title', '')
+            # Summaries only feed a bounded prompt, so cap them before they reach the cache
+            summary = getattr(entry, 'summary', '')[:MAX_SUMMARY_LENGTH]
+            published = getattr(entry, 'published', '')
+            
+            # Create structured entry data
+            entry_data = {
+                'title': title,
+                'summary': summary,
+                'published': published
+            }
+            
+            entries.append(entry_data)
+        
+        return entries
+    
+    def fetch_web_content(self, urls: List[str], max_content_length: int = 1000) -> Dict[str, str]:
+        """Fetch content from web URLs"""
+        if not urls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            results = list(executor.map(lambda url: self._fetch_web_page_locked(url, max_content_length), urls))
+        
+        return {url: content for url, content in zip(urls, results) if content}
+    
+    def _get_web_cache_path(self, url: str) -> Path:
+        """Get the cache file path for a web page URL"""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"web_cache_{digest}.json"
+    
+    def _fetch_web_page_locked(self, url: str, max_content_length: int) -> Optional[str]:
+        """Fetch a web page while holding its cache file lock, so concurrent callers revalidate one at a time"""
+        with self._lock_for(self._get_web_cache_path(url)):
+            return self._fetch_web_page(url, max_content_length)
+    
+    def _fetch_web_page(self, url: str, max_content_length: int) -> Optional[str]:
+        """
+        Fetch a single web page and extract its text, logging any failure
+        
+        Pages served with an ETag or Last-Modified header are cached on disk and
+        revalidated with a conditional GET, so unchanged pages are not re-downloaded.
+        """
+        try:
+            logger.info(f"🌐 Fetching web content: {url}")
+            
+            cache_file = self._get_web_cache_path(url)
+            cached = {}
+            if cache_file.exists():
+                try:
+                    cached = _json_loads(cache_file.read_bytes())
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to load web cache for {url}: {str(e)}")
+            
+            headers = {}
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+            
+            # Stream the body and stop reading at the byte cap instead of downloading the whole page
+            with self._http_session.get(url, headers=headers, timeout=HTTP_TIMEOUT, stream=True) as response:
+                if response.status_code == 304 and 'content' in cached:
+                    logger.info(f"🌐 Web page not modified, reusing cached content for {url}")
+                    content = cached['content']
+                    validators = None
+                else:
+                    response.raise_for_status()
+                    
+                    # Skip binary responses (images, PDFs, archives) before reading any of the body
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    if content_type and not (content_type.startswith('text/') or 'html' in content_type
+                                             or 'xml' in content_type):
+                        logger.warning(f"⚠️ Skipping non-text web content {url} ({content_type})")
+                        return None
+                    
+                    body = response.raw.read(MAX_WEB_RESPONSE_BYTES, decode_content=True)
+                    html_content = body.decode(response.encoding or 'utf-8', errors='replace')
+                    
+                    # Extract text content (basic implementation)
+                    content = self._extract_text_content(html_content)
+                    validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            
+            if validators and any(validators):
+                try:
+                    self._write_cache_file(cache_file, _json_dumps({
+                        'url': url,
+                        'etag': validators[0],
+                        'last_modified': validators[1],
+                        'content': content
+                    }))
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to save web cache for {url}: {str(e)}")
+            
+            if content:
+                # Truncate if too long
+                if len(content) > max_content_length:
+                    content = content[:max_content_length] + "..."
+                
+                logger.info(f"✅ Fetched {len(content)} characters from {url}")
+            return content
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch web content {url}: {str(e)}")
+            return None
+    
+    def _extract_text_content(self, html_content: str) -> str:
+        """Extract text content from HTML (basic implementation)"""
+        # Plain text needs neither tag stripping nor entity replacement
+        if '<' not in html_content and '&' not in html_content:
+            return _WS_RE.sub(' ', html_content).strip()
+        
+        # Use a real HTML parser when available (selectolax, then lxml) so script and style contents are dropped
+        if HTMLParser is not None:
+            tree = HTMLParser(html_content)
+            for node in tree.css('script, style, noscript'):
+                node.decompose()
+            root = tree.body or tree.root
+            # Separate text nodes so adjacent block elements don't run together
+            text = root.text(separator=' ', strip=True) if root else ''
+            return _WS_RE.sub(' ', text).strip()
+        
+        if lxml_etree is not None:
+            try:
+                root = lxml.html.document_fromstring(html_content)
+                lxml_etree.strip_elements(root, 'script', 'style', 'noscript', with_tail=False)
+                body = root.find('body')
+                # Join text nodes with spaces so adjacent block elements don't run together
+                text = ' '.join((body if body is not None else root).itertext())
+                return _WS_RE.sub(' ', text).strip()
+            except (ValueError, lxml_etree.ParserError):
+                pass  # Unparseable document; fall back to the regex path
+        
+        # Remove HTML tags. Kept as a separate pass from the whitespace collapse below:
+        # a combined tag|whitespace regex needs a Python callback per match and
+        # measured ~2.5x slower than two plain substitutions.
+        text = _HTML_TAG_RE.sub('', html_content)
+        
+        # Decode HTML entities (before collapsing whitespace so &nbsp; becomes a plain space)
+        text = unescape(text)
+        
+        # Remove extra whitespace
+        text = _WS_RE.sub(' ', text)
+        
+        return text.strip()
+    
+    @staticmethod
+    def _format_entry(entry: Dict[str, str]) -> List[str]:
+        """Format an RSS entry as a bold title followed by its summary and date in a code block"""
+        entry_get = entry.get
+        title = entry_get('title', '')
+        summary = entry_get('summary', '')
+        published = entry_get('published', '')
+        
+        # Title outside code block
+        lines = [f"**{title}**"]
+        
+        # Content inside code block
+        content_parts = [summary] if summary else []
+        if published:
+            content_parts.append(f"Published: {published}")
+        
+        if content_parts:
+            lines += ["```", "\n".join(content_parts), "```"]
+        
+        lines.append("")
+        return lines
+    
+    def get_personalization_context(self, include_rss: bool = True, include_web: bool = True) -> str:
+        """Get formatted personalization context for API calls"""
+        return self._cached(('context', include_rss, include_web),
+                            lambda: self._build_personalization_context(include_rss, include_web),
+                            uses_rss=include_rss)
+    
+    def _build_personalization_context(self, include_rss: bool, include_web: bool) -> str:
+        """Build the personalization context string"""
+        context_parts = []
+        
+        # Add basic context data
+        if self.context_data:
+            context_parts.append("## Personal Context:")
+            for section, items in self.context_data.items():
+                context_parts.append(f"### {section}:")
+                context_parts.extend(f"- {item}" for item in items)
+                context_parts.append("")
+        
+        # Add RSS content if requested
+        if include_rss and self.rss_feeds:
+            rss_content = self.fetch_rss_content()
+            if rss_content:
+                context_parts.append("## Recent News and Updates:")
+                for feed_url, entries in rss_content.items():
+                    # Find the feed info to show entry limit
+                    feed_info = self._rss_feeds_by_url.get(feed_url)
+                    entry_limit = feed_info.get('max_entries', 'all') if feed_info else 'all'
+                    context_parts.append(f"### From {feed_url} (max {entry_limit} entries):")
+                    context_parts.extend(itertools.chain.from_iterable(map(self._format_entry, entries)))
+        
+        # Add web content if requested
+        if include_web:
+            # URLs were collected from the context data while parsing
+            if self._web_urls:
+                web_content = self.fetch_web_content(self._web_urls)
+                if web_content:
+                    context_parts.append("## Web Content References:")
+                    for url, content in web_content.items():
+                        context_parts.append(f"### {url}:")
+                        context_parts.append(content)
+                        context_parts.append("")
+        
+        return "\n".join(context_parts)
+    
+    def _format_section(self, section: str) -> str:
+        """Format a context section as a bulleted list"""
+        if section in self.context_data:
+            items = self.context_data[section]
+            # Always add "- " prefix since we strip it during parsing
+            return '\n'.join([f"- {item}" for item in items])
+        return ""
+    
+    def get_data_section(self) -> str:
+        """Get formatted data section for template variables"""
+        return self._cached(('section', 'Data'), lambda: self._format_section('Data'))
+    
+    def get_themes_section(self) -> str:
+        """Get formatted themes section for template variables"""
+        return self._cached(('section', 'Themes'), lambda: self._format_section('Themes'))
+    
+    def get_conversation_styles_section(self) -> str:
+        """Get formatted conversation styles section for template variables"""
+        return self._cached(('section', 'Conversation Styles'), lambda: self._format_section('Conversation Styles'))
+    
+    def get_rss_summary(self) -> str:
+        """Get formatted RSS summary for template variables"""
+        return self._cached(('rss_summary',), self._build_rss_summary, uses_rss=True)
+    
+    def _build_rss_summary(self) -> str:
+        """Build the RSS summary string"""
+        if not self.rss_feeds:
+            return ""
+        
+        rss_content = self.fetch_rss_content()
+        if not rss_content:
+            return ""
+        
+        summary_parts = []
+        for feed_url, entries in rss_content.items():
+            feed_info = self._rss_feeds_by_url.get(feed_url)
+            entry_limit = feed_info.get('max_entries', 'all') if feed_info else 'all'
+            summary_parts.append(f"### From {feed_url} (max {entry_limit} entries):")
+            summary_parts.extend(itertools.chain.from_iterable(map(self._format_entry, entries)))
+        
+        return '\n'.join(summary_parts)
+    
+    def get_user_preferences(self) -> Dict[str, any]:
+        """Extract user preferences from context data"""
+        # Copy so callers cannot modify the memoized result
+        return dict(self._cached(('preferences',), self._build_user_preferences))
+    
+    def _build_user_preferences(self) -> Dict[str, any]:
+        """Build the user preferences dictionary"""
+        preferences = {}
+        
+        # Extract specific data points
+        for section, items in self.context_data.items():
+            section_lower = section.lower()
+            
+            if 'commander' in section_lower or 'name' in section_lower:
+                for item in items:
+                    if ':' in item:
+                        key, value = item.split(':', 1)
+                        preferences[key.strip()] = value.strip()
+            
+            elif 'squadron' in section_lower:
+                for item in items:
+                    if ':' in item:
+                        key, value = item.split(':', 1)
+                        preferences[key.strip()] = value.strip()
+            
+            elif 'theme' in section_lower:
+                themes = []
+                for item in items:
+                    if item.startswith('-'):
+                        themes.append(item[1:].strip())
+                    else:
+                        themes.append(item)
+                preferences['themes'] = themes
+            
+            elif 'fleet' in section_lower and 'carrier' in section_lower:
+                for item in items:
+                    if ':' in item:
+                        key, value = item.split(':', 1)
+                        preferences[key.strip()] = value.strip()
+        
+        return preferences
+    
+    def get_content_guidelines(self) -> List[str]:
+        """Extract content guidelines and preferences"""
+        # Copy so callers cannot modify the memoized result
+        return list(self._cached(('guidelines',), self._build_content_guidelines))
+    
+    def _build_content_guidelines(self) -> List[str]:
+        """Build the content guidelines list"""
+        guidelines = []
+        
+        for section, items in self.context_data.items():
+            section_lower = section.lower()
+            
+            if 'notes' in section_lower or 'guidelines' in section_lower or 'preferences' in section_lower:
+                for item in items:
+                    if item.startswith('-'):
+                        guidelines.append(item[1:].strip())
+                    else:
+                        guidelines.append(item)
+        
+        return guidelines
+    
+    def clear_rss_cache(self, feed_url: Optional[str] = None):
+        """Clear RSS cache for a specific feed, or all RSS and web page caches"""
+        self._context_cache.clear()
+        
+        if feed_url:
+            # Clear cache for specific feed
+            self._mem_cache.pop(feed_url, None)
+            try:
+                self._get_cache_file_path(feed_url).unlink()
+                logger.info(f"🗑️ Cleared RSS cache for {feed_url}")
+            except FileNotFoundError:
+                pass
+        else:
+            # Clear all RSS cache files (including any left over from the old pickle format) and web page caches
+            self._mem_cache.clear()
+            cleared = 0
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if ((entry.name.startswith('rss_cache_') and entry.name.endswith(('.json', '.pkl')))
+                            or (entry.name.startswith('web_cache_') and entry.name.endswith('.json'))):
+                        os.unlink(entry.path)
+                        cleared += 1
+            logger.info(f"🗑️ Cleared all RSS and web cache files ({cleared} files)")
+    
+    @staticmethod
+    def _read_cached_feed_url(cache_path: str) -> Optional[str]:
+        """Feed URL stored in a cache file, or None if unavailable"""
+        try:
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read()).get('url')
+        except Exception:
+            return None
+    
+    def get_cache_info(self) -> Dict[str, any]:
+        """Get information about the RSS cache"""
+        cache_info = {
+            'cache_dir': str(self.cache_dir),
+            'cache_duration_hours': self._cache_duration_s / 3600,
+            'cached_feeds': []
+        }
+        
+        now = time.time()
+        
+        # scandir yields names and stat results together, one stat call per cache file
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('rss_cache_') and entry.name.endswith('.json')):
+                    continue
+                
+                age = now - entry.stat().st_mtime
+                valid = age < self._cache_duration_s
+                cache_info['cached_feeds'].append({
+                    'file': entry.name,
+                    'url': self._read_cached_feed_url(entry.path),
+                    'age_hours': age / 3600 if valid else None,
+                    'valid': valid
+                })
+        
+        return cache_info